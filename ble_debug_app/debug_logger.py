@@ -1,5 +1,8 @@
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
@@ -65,10 +68,9 @@ class DebugLogger:
             handler.setLevel(logging.DEBUG)
             handler.setFormatter(formatter)
             self.handlers[name] = handler
-            self.logger.addHandler(handler)
             
             # Log file header
-            handler.emit(logging.LogRecord(
+            handler.handle(logging.LogRecord(
                 'BLEDebug', logging.INFO, '', 0,
                 f"=== {desc} ===\nTest started at: {datetime.now()}\n",
                 (), None
@@ -78,7 +80,16 @@ class DebugLogger:
         console = logging.StreamHandler(sys.stdout)
         console.setLevel(logging.INFO)
         console.setFormatter(formatter)
-        self.logger.addHandler(console)
+        
+        # Callers only enqueue records; a listener thread does the file and console writes
+        log_queue = queue.Queue(-1)
+        self.logger.addHandler(QueueHandler(log_queue))
+        self._listener = QueueListener(
+            log_queue, *self.handlers.values(), console,
+            respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.register(self._listener.stop)
 
     def start_test(self):
         """Start a new test session"""
@@ -173,7 +184,8 @@ class DebugLogger:
         record = logging.LogRecord(
             'BLEDebug', logging.DEBUG, '', 0, msg, (), None
         )
-        handler.emit(record)
+        # handle() takes the handler lock, since the listener thread writes here too
+        handler.handle(record)
             
     def debug(self, msg: str):
         """Log debug message"""
@@ -1,4 +1,5 @@
 import asyncio
+import logging
 import customtkinter as ctk
 from src.config.app_config import AppConfig
 from src.view.main_view import MainView
@@ -36,8 +37,13 @@ class App:
         self._init_event_handlers()
 
     def _setup_event_loop(self):
-        """Setup asyncio event loop"""
-        loop = asyncio.new_event_loop()
+        """Setup asyncio event loop, using uvloop where it is installed"""
+        try:
+            # Optional speedup; uvloop has no Windows build, so fall back there
+            import uvloop
+            loop = uvloop.new_event_loop()
+        except ImportError:
+            loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         return loop
     
@@ -192,5 +198,9 @@ class App:
         self.window.mainloop()
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
     app = App()
     app.run()
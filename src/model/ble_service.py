@@ -1,7 +1,10 @@
 import asyncio
+import logging
 
 from bleak import BleakClient, BleakScanner
 
+logger = logging.getLogger(__name__)
+
 
 class BLEDeviceInfo:
     """Model class for BLE device information"""
@@ -27,6 +30,8 @@ from abc import ABC, abstractmethod
 class BLEProfileChecker(ABC):
     """Abstract class for checking BLE profiles"""
 
+    __slots__ = ()
+
     @abstractmethod
     def check_firmware_revision(self):
         """Check firmware revision string"""
@@ -51,6 +56,16 @@ class BLEProfileChecker(ABC):
 class BLEService(BLEProfileChecker):
     """Model for BLE service operations"""
 
+    __slots__ = (
+        "client",
+        "_connected",
+        "connected_device",
+        "_disconnected_event",
+        "_disconnect_requested",
+        "on_connection_lost",
+        "initialized",
+    )
+
     _instance = None
 
     def __new__(cls):
@@ -63,21 +78,57 @@ class BLEService(BLEProfileChecker):
             self.client = None
             self._connected = False
             self.connected_device = None
+            self._disconnected_event = asyncio.Event()
+            self._disconnect_requested = False
+            # Optional callback run when the link drops without disconnect()
+            self.on_connection_lost = None
             self.initialized = True
 
+    def _on_client_disconnected(self, client):
+        """Signal that the BLE link has been dropped"""
+        # A late callback from a client that connect() already replaced
+        if client is not self.client:
+            return
+
+        self._disconnected_event.set()
+        if not self._disconnect_requested:
+            # The link is gone; stop reporting it as connected
+            self._connected = False
+            if self.on_connection_lost:
+                self.on_connection_lost()
+
+    async def wait_disconnected(self, timeout):
+        """Wait until the BLE stack reports the link as disconnected
+
+        Args:
+            timeout: Maximum time to wait in seconds
+        Returns:
+            True if the disconnect was reported within the timeout
+        """
+        try:
+            await asyncio.wait_for(self._disconnected_event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
     async def scan_devices(self):
         """Scan for available BLE devices"""
         try:
             devices = await BleakScanner.discover()
             return [BLEDeviceInfo.from_discovered_device(device) for device in devices]
         except Exception as e:
-            print(f"Error scanning for devices: {e}")
+            logger.error("Error scanning for devices: %s", e)
             return []
 
     async def connect(self, device_info):
         """Connect to a BLE device"""
         try:
-            self.client = BleakClient(device_info.address)
+            self._disconnected_event.clear()
+            self._disconnect_requested = False
+            self.client = BleakClient(
+                device_info.address,
+                disconnected_callback=self._on_client_disconnected,
+            )
             await self.client.connect()
             if not self.client.is_connected:
                 return False
@@ -89,10 +140,10 @@ class BLEService(BLEProfileChecker):
                 if self.client.services:
                     break
                 if attempt < max_retries - 1:
-                    print("Waiting for services...")
+                    logger.debug("Waiting for services...")
 
             if not self.client.services:
-                print("No services discovered")
+                logger.warning("No services discovered")
                 return False
 
             self._connected = True
@@ -100,7 +151,7 @@ class BLEService(BLEProfileChecker):
             return True
         except Exception as e:
             self._connected = False
-            print(f"Connection error: {e}")
+            logger.error("Connection error: %s", e)
             return False
 
     async def disconnect(self):
@@ -109,10 +160,11 @@ class BLEService(BLEProfileChecker):
             return True
 
         try:
+            self._disconnect_requested = True
             await self.client.disconnect()
             return True
         except Exception as e:
-            print(f"Disconnection error: {e}")
+            logger.error("Disconnection error: %s", e)
             return False
         finally:
             # Always cleanup client state
@@ -132,7 +184,7 @@ class BLEService(BLEProfileChecker):
         try:
             return await self.client.read_gatt_char(uuid)
         except Exception as e:
-            print(f"Error reading characteristic {uuid}: {e}")
+            logger.error("Error reading characteristic %s: %s", uuid, e)
             return None
 
     async def write_characteristic(self, uuid, data):
@@ -144,7 +196,7 @@ class BLEService(BLEProfileChecker):
             await self.client.write_gatt_char(uuid, data)
             return True
         except Exception as e:
-            print(f"Error writing characteristic {uuid}: {e}")
+            logger.error("Error writing characteristic %s: %s", uuid, e)
             return False
 
     async def start_notify(self, uuid, callback):
@@ -156,7 +208,7 @@ class BLEService(BLEProfileChecker):
             await self.client.start_notify(uuid, callback)
             return True
         except Exception as e:
-            print(f"Error starting notifications for {uuid}: {e}")
+            logger.error("Error starting notifications for %s: %s", uuid, e)
             return False
 
     async def stop_notify(self, uuid):
@@ -172,5 +224,5 @@ class BLEService(BLEProfileChecker):
                 err_code = str(e.args[0])
                 if err_code == "61":  # Already stopped
                     return True
-            print(f"Error stopping notifications for {uuid}: {e}")
+            logger.error("Error stopping notifications for %s: %s", uuid, e)
             return False
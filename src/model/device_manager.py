@@ -1,9 +1,14 @@
 import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 class DeviceManager:
     """Class for managing device services and notifications"""
 
+    __slots__ = ("service", "presenters", "initialized")
+
     _instance = None
 
     def __new__(cls, ble_service=None, presenters=None):
@@ -54,28 +59,40 @@ class DeviceManager:
         for attempt in range(max_retries):
             try:
                 if await self.presenters[service_name].start_notifications():
-                    print(f"✓ Started {service_name} service (attempt {attempt + 1})")
+                    logger.info(
+                        "✓ Started %s service (attempt %d)", service_name, attempt + 1
+                    )
                     return True
 
                 if attempt < max_retries - 1:
-                    print(f"! {service_name} service start returned False, retrying...")
+                    logger.warning(
+                        "! %s service start returned False, retrying...", service_name
+                    )
                     await asyncio.sleep(delay)
 
             except Exception as e:
                 if attempt < max_retries - 1:
-                    print(
-                        f"! Error starting {service_name} service (attempt {attempt + 1}): {e}"
+                    logger.warning(
+                        "! Error starting %s service (attempt %d): %s",
+                        service_name,
+                        attempt + 1,
+                        e,
                     )
                     await asyncio.sleep(delay)
                 else:
-                    print(
-                        f"✕ Failed to start {service_name} service after {max_retries} attempts: {e}"
+                    logger.error(
+                        "✕ Failed to start %s service after %d attempts: %s",
+                        service_name,
+                        max_retries,
+                        e,
                     )
 
         return False
 
     async def start_services(self):
         """Start all device services concurrently after connection"""
+        SERVICE_START_TIMEOUT = 2.0  # seconds per service
+
         try:
             # Wait for services to be fully discovered
             await asyncio.sleep(0.5)
@@ -91,17 +108,30 @@ class DeviceManager:
                 "log",  # Log manager
             ]
 
-            # Start all services concurrently
+            # Start all services concurrently, cancelling any that hang
             results = await asyncio.gather(
-                *[self._start_service_with_retry(service) for service in services],
+                *[
+                    asyncio.wait_for(
+                        self._start_service_with_retry(service),
+                        timeout=SERVICE_START_TIMEOUT,
+                    )
+                    for service in services
+                ],
                 return_exceptions=True,
             )
 
             # Process results and collect failures
             failures = []
             for service, result in zip(services, results):
-                if isinstance(result, Exception):
-                    print(f"Error starting {service}: {result}")
+                if isinstance(result, asyncio.TimeoutError):
+                    logger.error(
+                        "Timed out starting %s after %.1fs",
+                        service,
+                        SERVICE_START_TIMEOUT,
+                    )
+                    failures.append(service)
+                elif isinstance(result, Exception):
+                    logger.error("Error starting %s: %s", service, result)
                     failures.append(service)
                 elif not result:
                     failures.append(service)
@@ -109,15 +139,16 @@ class DeviceManager:
             # Read timestamp and auto-sync device time
             await self.presenters["timestamp"].read_timestamp()
             if await self.presenters["timestamp"].write_current_time():
-                print("✓ Device time synchronized with PC")
+                logger.info("✓ Device time synchronized with PC")
             else:
-                print("! Failed to synchronize device time")
+                logger.warning("! Failed to synchronize device time")
 
             # Handle critical services
             critical_services = {"imu1", "imu2"}
             if critical_services.intersection(failures):
-                print(
-                    f"Critical service(s) failed: {critical_services.intersection(failures)}"
+                logger.error(
+                    "Critical service(s) failed: %s",
+                    critical_services.intersection(failures),
                 )
                 await self.cleanup()
                 return False
@@ -125,7 +156,7 @@ class DeviceManager:
             return True
 
         except Exception as e:
-            print(f"Error during service initialization: {e}")
+            logger.error("Error during service initialization: %s", e)
             await self.cleanup()
             return False
 
@@ -168,10 +199,10 @@ class DeviceManager:
                     if hasattr(view, "clear_values"):
                         view.clear_values()
                 except Exception as e:
-                    print(f"Error clearing {service} view: {e}")
+                    logger.error("Error clearing %s view: %s", service, e)
 
         except Exception as e:
-            print(f"Error during cleanup: {e}")
+            logger.error("Error during cleanup: %s", e)
 
     async def connect(self, device_info):
         """Connect to device only"""
@@ -188,7 +219,7 @@ class DeviceManager:
             # Only connect, don't start services
             return await self.presenters["connection"].connect_to_device(profile)
         except Exception as e:
-            print(f"Error connecting to device: {e}")
+            logger.error("Error connecting to device: %s", e)
             return False
 
     async def start_device_services(self):
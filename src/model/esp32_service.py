@@ -1,35 +1,36 @@
 """ESP32 BLE Service Implementation"""
 
 import asyncio
+import random
 
 from src.config.constant import BLEConstants as C
 from src.model.ble_service import BLEService
 from src.model.device_manager import DeviceManager
 
 
+async def _backoff(attempt, base=0.05, cap=0.8):
+    """Sleep before a retry: exponential delay capped at cap, with jitter"""
+    await asyncio.sleep(min(cap, base * 2**attempt) * (0.5 + random.random()))
+
+
 class ESP32BLEService(BLEService):
     """ESP32 BLE service for VR glove device"""
 
     REQUIRED_SERVICES = C.REQUIRED_SERVICES
     CHARACTERISTICS = C.CHARACTERISTICS
 
-    # Config maps
-    locals().update(
-        {
-            name: getattr(C, name)
-            for name in [
-                "ACCEL_GYRO_FREQ_MAP",
-                "MAG_FREQ_MAP",
-                "ACCEL_RANGE_MAP",
-                "GYRO_RANGE_MAP",
-                "MAG_RANGE_MAP",
-                "ACCEL_GYRO_FREQ_REV_MAP",
-                "MAG_FREQ_REV_MAP",
-                "ACCEL_RANGE_REV_MAP",
-                "GYRO_RANGE_REV_MAP",
-                "MAG_RANGE_REV_MAP",
-            ]
-        }
+    # UUID -> data class, so lookups don't scan CHARACTERISTICS
+    _uuid_to_class = {uuid: cls for uuid, cls in CHARACTERISTICS.values()}
+
+    # Required service UUIDs, lowercased once for set comparisons
+    _REQUIRED_LC = frozenset(uuid.lower() for uuid in REQUIRED_SERVICES.values())
+
+    # Device information characteristics never change while connected
+    _DEVICE_INFO_UUIDS = frozenset(
+        uuid
+        for name, (uuid, _) in CHARACTERISTICS.items()
+        if name
+        in ("FIRMWARE_UUID", "MODEL_NUMBER_UUID", "MANUFACTURER_UUID", "HARDWARE_UUID")
     )
 
     # Notification types for dynamic method generation
@@ -48,9 +49,21 @@ class ESP32BLEService(BLEService):
         "battery_charging",
     ]
 
+    # UUID attributes and generated notify methods are known up front
+    __slots__ = (
+        "_callbacks",
+        "_char_cache",
+        "_char_objs",
+        "loop",
+        *CHARACTERISTICS,
+        *(f"{op}_{t}_notify" for t in _NOTIFY_TYPES for op in ("start", "stop")),
+    )
+
     def __init__(self):
         super().__init__()
         self._callbacks = {}
+        self._char_cache = {}
+        self._char_objs = {}
         self.loop = None
 
         # Set UUIDs as attributes
@@ -99,43 +112,52 @@ class ESP32BLEService(BLEService):
             return False
 
         for attempt in range(5):
-            await asyncio.sleep(0.2)
+            if attempt:
+                await _backoff(attempt)
             if not self.client or not self.client.is_connected:
                 return False
 
             if not self.client.services:
                 continue
 
-            services = {str(service.uuid).lower() for service in self.client.services}
-            missing = [
-                name
-                for name, uuid in self.REQUIRED_SERVICES.items()
-                if uuid.lower() not in services
-            ]
-
-            if not missing:
+            services = frozenset(
+                str(service.uuid).lower() for service in self.client.services
+            )
+            if services.issuperset(self._REQUIRED_LC):
+                self._resolve_characteristics()
                 return True
             elif attempt == 4:
                 return False
         return True  # Generic data read/write methods
 
+    def _resolve_characteristics(self):
+        """Look up each known characteristic once so reads skip the UUID search"""
+        services = self.client.services
+        self._char_objs = {}
+        for uuid in self._callbacks:
+            char = services.get_characteristic(uuid)
+            if char is not None:
+                self._char_objs[uuid] = char
+
     async def _read_data(self, uuid):
         """Generic data reading"""
         if not self.is_connected():
             return None
+        cached = self._char_cache.get(uuid)
+        if cached is not None:
+            return cached
         try:
-            data = await self.read_characteristic(uuid)
+            data = await self.read_characteristic(self._char_objs.get(uuid, uuid))
             if not data:
                 return None
-            data_class = next(
-                (cls for _, (u, cls) in self.CHARACTERISTICS.items() if u == uuid), None
-            )
-            return (
-                data.decode("utf-8")
-                if data_class == str
-                else data_class.from_bytes(data) if data_class else None
-            )
-        except:
+            if uuid in self._DEVICE_INFO_UUIDS:
+                # Device information strings are ASCII per the GATT spec
+                value = data.decode("ascii", errors="replace")
+                self._char_cache[uuid] = value
+                return value
+            data_class = self._uuid_to_class.get(uuid)
+            return data_class.from_bytes(data) if data_class else None
+        except Exception:
             return None
 
     async def _write_data(self, uuid, data):
@@ -143,10 +165,10 @@ class ESP32BLEService(BLEService):
         if not self.is_connected() or not data:
             return False
         try:
-            raw_data = data.raw_data if hasattr(data, "raw_data") else data
-            await self.write_characteristic(uuid, raw_data)
+            raw_data = getattr(data, "raw_data", data)
+            await self.write_characteristic(self._char_objs.get(uuid, uuid), raw_data)
             return True
-        except:
+        except Exception:
             return False
 
     # Profile methods using generic read
@@ -167,9 +189,11 @@ class ESP32BLEService(BLEService):
         if not self.is_connected():
             return None
         try:
-            data = await self.read_characteristic(self.CONFIG_UUID)
+            data = await self.read_characteristic(
+                self._char_objs.get(self.CONFIG_UUID, self.CONFIG_UUID)
+            )
             return data if data and len(data) >= 15 else None
-        except:
+        except Exception:
             return None
 
     async def write_config(self, data):
@@ -183,9 +207,11 @@ class ESP32BLEService(BLEService):
     async def connect(self, device_info):
         """Connect to device with retry logic"""
         try:
+            self._char_cache.clear()
+            self._char_objs = {}
             if self.is_connected():
                 await self.disconnect()
-                await asyncio.sleep(1.0)
+                await self.wait_disconnected(timeout=1.0)
 
             # Connection retry
             for attempt in range(5):
@@ -193,35 +219,41 @@ class ESP32BLEService(BLEService):
                     if await super().connect(device_info):
                         break
                     if attempt < 4:
-                        await asyncio.sleep(0.5)
+                        await _backoff(attempt)
                 except Exception:
                     if attempt < 4:
-                        await asyncio.sleep(0.5)
+                        await _backoff(attempt)
                         continue
                     return False
             else:
                 return False
 
-            await asyncio.sleep(1.0)
+            # No fixed post-connect sleep: BLEService.connect only returns True
+            # once the client reports connected with services discovered
 
             # Check services
             if not await self.check_services():
                 await self.disconnect()
                 return False
 
-            await asyncio.sleep(0.5)
-
-            # Read profiles
+            # Read profiles concurrently
             try:
-                device_info.firmware = await self.check_firmware_revision()
-                device_info.model = await self.check_model_number()
-                device_info.manufacturer = await self.check_manufacturer()
-                device_info.hardware = await self.check_hardware_revision()
-            except:
+                (
+                    device_info.firmware,
+                    device_info.model,
+                    device_info.manufacturer,
+                    device_info.hardware,
+                ) = await asyncio.gather(
+                    self.check_firmware_revision(),
+                    self.check_model_number(),
+                    self.check_manufacturer(),
+                    self.check_hardware_revision(),
+                )
+            except Exception:
                 pass  # Continue even if profile reading fails
 
             return True
-        except:
+        except Exception:
             await self.disconnect()
             return False
 
@@ -230,33 +262,64 @@ class ESP32BLEService(BLEService):
         if not view:
             return False
         try:
-            await self._start_notify_generic(
-                self.BATTERY_LEVEL_UUID, view.update_battery
-            )
-            await self._start_notify_generic(
-                self.BATTERY_CHARGING_UUID, view.update_charging
+            await asyncio.gather(
+                self._start_notify_generic(
+                    self.BATTERY_LEVEL_UUID, view.update_battery
+                ),
+                self._start_notify_generic(
+                    self.BATTERY_CHARGING_UUID, view.update_charging
+                ),
             )
             return True
-        except:
-            return False  # Simplified notification handler
+        except Exception:
+            return False
 
-    async def _notification_handler(self, sender, data, callback, data_class, uuid):
-        """Unified notification handler"""
-        try:
-            if uuid == self.BATTERY_LEVEL_UUID:
-                callback(int(data[0]))
-            elif uuid == self.BATTERY_CHARGING_UUID:
-                callback("Charging" if data[0] == 1 else "Not Charging")
-            else:
-                parsed_data = (
-                    data.decode("utf-8")
-                    if data_class == str
-                    else data_class.from_bytes(data) if data_class else None
-                )
-                if parsed_data and callback:
-                    await callback(sender, parsed_data)
-        except:
-            pass  # Silent fail for notifications
+    def _make_notification_handler(self, uuid, callback, data_class):
+        """Build a notification handler specialised for one characteristic
+
+        The UUID and data class are resolved here, once per subscription, so
+        the per-notification path does no branching on them.
+        """
+
+        def loop_ready():
+            return self.loop and not self.loop.is_closed()
+
+        if uuid == self.BATTERY_LEVEL_UUID:
+
+            async def handler(sender, data):
+                if loop_ready():
+                    try:
+                        callback(data[0])
+                    except Exception:
+                        pass  # Silent fail for notifications
+
+        elif uuid == self.BATTERY_CHARGING_UUID:
+
+            async def handler(sender, data):
+                if loop_ready():
+                    try:
+                        callback("Charging" if data[0] == 1 else "Not Charging")
+                    except Exception:
+                        pass  # Silent fail for notifications
+
+        elif data_class and callback:
+            from_bytes = data_class.from_bytes
+
+            async def handler(sender, data):
+                if loop_ready():
+                    try:
+                        parsed_data = from_bytes(data)
+                        if parsed_data:
+                            await callback(sender, parsed_data)
+                    except Exception:
+                        pass  # Silent fail for notifications
+
+        else:
+
+            async def handler(sender, data):
+                pass  # Nothing to decode or deliver
+
+        return handler
 
     async def _start_notify_generic(self, uuid, callback, retries=5):
         """Generic notification starter with retry"""
@@ -265,24 +328,15 @@ class ESP32BLEService(BLEService):
 
         for attempt in range(retries):
             try:
-                data_class = next(
-                    (cls for _, (u, cls) in self.CHARACTERISTICS.items() if u == uuid),
-                    None,
-                )
+                data_class = self._uuid_to_class.get(uuid)
                 self._callbacks[uuid] = callback
+                handler = self._make_notification_handler(uuid, callback, data_class)
 
-                async def handler(sender, data):
-                    if self.loop and not self.loop.is_closed():
-                        await self._notification_handler(
-                            sender, data, callback, data_class, uuid
-                        )
-
-                await asyncio.sleep(0.1)
                 await self.client.start_notify(uuid, handler)
                 return True
-            except:
+            except Exception:
                 if attempt < retries - 1:
-                    await asyncio.sleep(0.2)
+                    await _backoff(attempt)
                     continue
         return False
 
@@ -295,7 +349,7 @@ class ESP32BLEService(BLEService):
             await self.client.stop_notify(uuid)
             self._callbacks[uuid] = None
             return True
-        except:
+        except Exception:
             self._callbacks[uuid] = None
             return False  # Data reading methods using generic reader
 
@@ -310,10 +364,3 @@ class ESP32BLEService(BLEService):
 
     def write_timestamp(self, data):
         return self._write_data(self.TIMESTAMP_CHAR_UUID, data)
-
-    def read_device_name(self):
-        return (
-            self.read_characteristic(self.MODEL_NUMBER_UUID)
-            if self.is_connected()
-            else None
-        )
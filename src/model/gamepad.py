@@ -1,5 +1,11 @@
+import logging
 import struct
 
+logger = logging.getLogger(__name__)
+
+# Joystick X and Y axes, read in place ahead of the button byte
+_JOYSTICK_STRUCT = struct.Struct("<2h")
+
 
 class JoystickData:
     """Model class representing joystick data"""
@@ -26,11 +32,11 @@ class JoystickData:
 
         try:
             # Unpack 2 int16 values and 1 uint8
-            x, y = struct.unpack("<2h", data[0:4])
+            x, y = _JOYSTICK_STRUCT.unpack_from(data)
             button = data[4]
             return cls(x=x, y=y, button_state=button, raw_data=data)
         except Exception as e:
-            print(f"Error parsing joystick data: {e}")
+            logger.error("Error parsing joystick data: %s", e)
             return None
 
     def to_hex_string(self):
@@ -72,7 +78,7 @@ class ButtonsData:
             states = list(data)
             return cls(states=states, raw_data=data)
         except Exception as e:
-            print(f"Error parsing buttons data: {e}")
+            logger.error("Error parsing buttons data: %s", e)
             return None
 
     def to_hex_string(self):
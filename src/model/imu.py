@@ -1,16 +1,27 @@
+import logging
 import struct
+from typing import NamedTuple, Optional
 
+import numpy as np
 
-class IMUEulerData:
+logger = logging.getLogger(__name__)
+
+# Precompiled packet layouts
+_IMU_STRUCT = struct.Struct("<9h")  # 9 int16: accel, gyro, mag
+_EULER_STRUCT = struct.Struct("<3fB")  # 3 float32 euler + uint8 calib
+
+
+class IMUEulerData(NamedTuple):
     """Model class representing IMU Euler angles data"""
 
-    def __init__(self, yaw=0, pitch=0, roll=0, calib_status=0, raw_data=None):
-        # Euler angles in degrees
-        self.euler = {"yaw": yaw, "pitch": pitch, "roll": roll}
-        # Calibration status
-        self.calib_status = calib_status
-        # Raw binary data
-        self.raw_data = raw_data
+    # Euler angles in degrees
+    yaw: float = 0
+    pitch: float = 0
+    roll: float = 0
+    # Calibration status
+    calib_status: int = 0
+    # Raw binary data
+    raw_data: Optional[bytes] = None
 
     @classmethod
     def from_bytes(cls, data):
@@ -19,33 +30,29 @@ class IMUEulerData:
             return None
 
         try:
-            # Unpack 3 float32 values for euler angles
-            yaw, pitch, roll = struct.unpack("<3f", data[0:12])
-            # Last byte is calibration status
-            calib = data[12]
+            # 3 float32 euler angles followed by the calibration status byte
+            yaw, pitch, roll, calib = _EULER_STRUCT.unpack_from(data)
             return cls(yaw, pitch, roll, calib, data)
         except Exception as e:
-            print(f"Error parsing IMU Euler data: {e}")
+            logger.error("Error parsing IMU Euler data: %s", e)
             return None
 
     def to_bytes(self):
         """Convert to byte array"""
         try:
-            return struct.pack(
-                "<3fB",
-                self.euler["yaw"],
-                self.euler["pitch"],
-                self.euler["roll"],
-                self.calib_status,
+            return _EULER_STRUCT.pack(
+                self.yaw, self.pitch, self.roll, self.calib_status
             )
         except Exception as e:
-            print(f"Error packing IMU Euler data: {e}")
+            logger.error("Error packing IMU Euler data: %s", e)
             return None
 
 
 class IMUData:
     """Model class representing IMU sensor data"""
 
+    __slots__ = ("ax", "ay", "az", "gx", "gy", "gz", "mx", "my", "mz", "raw_data")
+
     def __init__(
         self,
         accel_x=0,
@@ -59,57 +66,58 @@ class IMUData:
         mag_z=0,
         raw_data=None,
     ):
-        # Accelerometer data
-        self.accel = {"x": accel_x, "y": accel_y, "z": accel_z}
+        # Accelerometer, gyroscope and magnetometer axes
+        self.ax, self.ay, self.az = accel_x, accel_y, accel_z
+        self.gx, self.gy, self.gz = gyro_x, gyro_y, gyro_z
+        self.mx, self.my, self.mz = mag_x, mag_y, mag_z
+        # Raw binary data
+        self.raw_data = raw_data
 
-        # Gyroscope data
-        self.gyro = {"x": gyro_x, "y": gyro_y, "z": gyro_z}
+    def _axes(self):
+        """The nine axis values in packet order"""
+        return (
+            self.ax,
+            self.ay,
+            self.az,
+            self.gx,
+            self.gy,
+            self.gz,
+            self.mx,
+            self.my,
+            self.mz,
+        )
 
-        # Magnetometer data
-        self.mag = {"x": mag_x, "y": mag_y, "z": mag_z}
+    @property
+    def array(self):
+        """The nine axis values as an ndarray (ax, ay, az, gx, gy, gz, mx, my, mz)"""
+        return np.array(self._axes())
 
-        # Raw binary data
-        self.raw_data = raw_data
+    def to_row(self, timestamp, yaw, pitch, roll):
+        """Build a CSV log row: timestamp, nine axes, then euler angles"""
+        return (timestamp, *self._axes(), yaw, pitch, roll)
 
     @classmethod
     def from_bytes(cls, data):
         """Create IMUData object from byte array"""
-        if not data or len(data) != 18:  # 9 int16 values
+        if not data or len(data) != _IMU_STRUCT.size:
             return None
+        return cls(*_IMU_STRUCT.unpack_from(data), raw_data=data)
 
-        try:
-            values = struct.unpack("<9h", data)
-            return cls(
-                accel_x=values[0],
-                accel_y=values[1],
-                accel_z=values[2],
-                gyro_x=values[3],
-                gyro_y=values[4],
-                gyro_z=values[5],
-                mag_x=values[6],
-                mag_y=values[7],
-                mag_z=values[8],
-                raw_data=data,
-            )
-        except Exception as e:
-            print(f"Error parsing IMU data: {e}")
+    @classmethod
+    def from_bytes_np(cls, data):
+        """Decode raw IMU bytes into an int16 array without copying
+
+        Returns:
+            ndarray of 9 values (ax, ay, az, gx, gy, gz, mx, my, mz), or None
+        """
+        if not data or len(data) != _IMU_STRUCT.size:
             return None
+        return np.frombuffer(data, dtype="<i2", count=9)  # 9 int16 values
 
     def to_bytes(self):
         """Convert to byte array"""
         try:
-            return struct.pack(
-                "<9h",
-                self.accel["x"],
-                self.accel["y"],
-                self.accel["z"],
-                self.gyro["x"],
-                self.gyro["y"],
-                self.gyro["z"],
-                self.mag["x"],
-                self.mag["y"],
-                self.mag["z"],
-            )
+            return _IMU_STRUCT.pack(*self._axes())
         except Exception as e:
-            print(f"Error packing IMU data: {e}")
+            logger.error("Error packing IMU data: %s", e)
             return None
@@ -1,3 +1,8 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+
 class OverallStatus:
     """Model class representing overall system status"""
 
@@ -23,7 +28,7 @@ class OverallStatus:
     def from_bytes(cls, data):
         """Create OverallStatus object from byte array"""
         if not data:
-            print("No overall status data received")
+            logger.warning("No overall status data received")
             return None
 
         if len(data) != 4:  # 4 uint8 values
@@ -44,7 +49,7 @@ class OverallStatus:
                 return None
             return cls(fuelgause=fuelgause, imu1=imu1, imu2=imu2, raw_data=data)
         except Exception as e:
-            print(f"Error parsing Overall Status data: {e}")
+            logger.error("Error parsing Overall Status data: %s", e)
             return None
 
     def to_hex_string(self):
@@ -1,18 +1,28 @@
+from types import MappingProxyType
+
+# Shared profile of the connected device, see DeviceProfile.get_instance
+_instance = None
+
+
 class DeviceProfile:
     """Model class representing complete device profile information"""
 
-    _instance = None
-
-    def __new__(cls, address=None, name="Unknown", rssi=0):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+    __slots__ = (
+        "address",
+        "name",
+        "rssi",
+        "firmware",
+        "model",
+        "manufacturer",
+        "hardware",
+        "connection_status",
+        "battery_level",
+        "charging_state",
+        "_display_cache",
+    )
 
     def __init__(self, address=None, name="Unknown", rssi=0):
-        if self._initialized:
-            return
-        self._initialized = True
+        self._display_cache = None
         # Basic device info
         self.address = address
         self.name = name
@@ -29,17 +39,31 @@ class DeviceProfile:
         self.battery_level = 0
         self.charging_state = "Not Charging"
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # Any change to a public field invalidates the cached display info
+        if not name.startswith("_"):
+            super().__setattr__("_display_cache", None)
+
     @classmethod
     def get_instance(cls):
-        """Get the singleton instance"""
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        """Get the shared profile, creating an empty one on first use"""
+        global _instance
+        if _instance is None:
+            _instance = cls()
+        return _instance
+
+    @classmethod
+    def create(cls, address=None, name="Unknown", rssi=0):
+        """Replace the shared profile with a new one for the given device"""
+        global _instance
+        _instance = cls(address, name, rssi)
+        return _instance
 
     @classmethod
     def from_discovered_device(cls, device):
         """Create from discovered BLE device"""
-        return cls(
+        return cls.create(
             address=device.address,
             name=device.name or "Unknown Device",
             rssi=device.rssi or 0,
@@ -71,14 +95,24 @@ class DeviceProfile:
             self.hardware = hardware
 
     def get_display_info(self):
-        """Get information formatted for display"""
-        return {
-            "name": self.name,
-            "status": self.connection_status,
-            "battery": f"{self.battery_level}%" if self.battery_level else "--",
-            "charging": self.charging_state,
-            "firmware": self.firmware,
-            "model": self.model,
-            "manufacturer": self.manufacturer,
-            "hardware": self.hardware,
-        }
+        """Get information formatted for display
+
+        Returns:
+            Read-only mapping, rebuilt only after a profile field has changed
+        """
+        if self._display_cache is None:
+            self._display_cache = MappingProxyType(
+                {
+                    "name": self.name,
+                    "status": self.connection_status,
+                    "battery": (
+                        f"{self.battery_level}%" if self.battery_level else "--"
+                    ),
+                    "charging": self.charging_state,
+                    "firmware": self.firmware,
+                    "model": self.model,
+                    "manufacturer": self.manufacturer,
+                    "hardware": self.hardware,
+                }
+            )
+        return self._display_cache
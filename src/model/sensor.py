@@ -1,5 +1,8 @@
+import logging
 import struct
 
+logger = logging.getLogger(__name__)
+
 
 class FlexSensorData:
     """Model class representing flex sensor data"""
@@ -20,7 +23,7 @@ class FlexSensorData:
             values = list(struct.unpack("<5f", data))
             return cls(values=values, raw_data=data)
         except Exception as e:
-            print(f"Error parsing flex sensor data: {e}")
+            logger.error("Error parsing flex sensor data: %s", e)
             return None
 
     def to_hex_string(self):
@@ -58,7 +61,7 @@ class ForceSensorData:
             value = struct.unpack("<f", data)[0]
             return cls(value=value, raw_data=data)
         except Exception as e:
-            print(f"Error parsing force sensor data: {e}")
+            logger.error("Error parsing force sensor data: %s", e)
             return None
 
     def to_hex_string(self):
@@ -1,5 +1,8 @@
+import logging
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
 
 class TimestampData:
     """Model class representing timestamp data"""
@@ -33,7 +36,7 @@ class TimestampData:
             unix_timestamp = timestamp // 1000  # Convert ms to seconds
             return cls(unix_timestamp=unix_timestamp, raw_data=data)
         except Exception as e:
-            print(f"Error parsing timestamp data: {e}")
+            logger.error("Error parsing timestamp data: %s", e)
             return None
 
     @classmethod
@@ -1,7 +1,12 @@
 import asyncio
+import logging
+import random
+from functools import partial
 
 from src.model.device_manager import DeviceManager
 
+logger = logging.getLogger(__name__)
+
 
 class ConnectionPresenter:
     """Presenter for handling device connections"""
@@ -10,71 +15,108 @@ class ConnectionPresenter:
         self.view = view
         self.service = ble_service
         self.loop = loop
+        # Resolved once; None when the service has no device services to start
+        self._start_services = getattr(ble_service, "start_services", None)
+        # Resolved once; None when the view has no logging to stop
+        self._stop_view_logging = getattr(view, "_stop_logging", None)
+        # Whether a dropped link should trigger auto-reconnection
+        self._monitoring = False
+        self._reconnect_task = None
+        # DeviceManager is built after the presenters, so it is fetched lazily
+        self._device_manager = None
+
+        # The BLE stack reports dropped links, so no periodic GATT probe is needed
+        self.service.on_connection_lost = self._on_connection_lost
 
         # Setup heartbeat handler
         self.view.set_heartbeat_handler(self._check_connection)
 
     async def _check_connection(self):
-        """Periodic check of connection status with auto-reconnection"""
+        """Start watching the connection for drops (heartbeat handler)"""
+        self._monitoring = True
+
+    def _on_connection_lost(self):
+        """Called by the BLE service when the link drops unexpectedly"""
+        if not self._monitoring:
+            return
+        if self._reconnect_task and not self._reconnect_task.done():
+            return
+        self._reconnect_task = self.loop.create_task(self._handle_connection_lost())
+
+    def _stop_monitoring(self):
+        """Stop watching the connection and cancel any running reconnection"""
+        self._monitoring = False
+        task = self._reconnect_task
+        self._reconnect_task = None
+        if task and task is not asyncio.current_task() and not task.done():
+            task.cancel()
+
+    async def _handle_connection_lost(self):
+        """Auto-reconnect after the BLE link was lost"""
         MAX_RECONNECT_ATTEMPTS = 5
-        RECONNECT_DELAY = 5  # seconds
-
-        while self.service.is_connected():
-            try:
-                await asyncio.sleep(3)  # Check every 3 seconds
-                name = await self.service.read_device_name()
-                if not name:
-                    profile = self.get_connected_device()
-                    if not profile:
-                        print("No device profile available for reconnection")
-                        await self.disconnect()
-                        break
-
-                    print("\nConnection lost, attempting auto-reconnection...")
-                    profile.update_connection_status("Connection Lost")
-
-                    # Stop logging if active before showing connection lost
-                    if hasattr(self.view, "_stop_logging"):
-                        self.view._stop_logging()
-
-                    self.view.show_connection_lost()
-
-                    # Stop services before attempting reconnection
-                    if hasattr(self.service, "start_services"):
-                        await self.service.disconnect()
-                        await asyncio.sleep(1)  # Wait for cleanup
-
-                    # Try reconnecting up to MAX_RECONNECT_ATTEMPTS times
-                    for attempt in range(MAX_RECONNECT_ATTEMPTS):
-                        print(
-                            f"\nAuto-reconnection attempt {attempt + 1}/{MAX_RECONNECT_ATTEMPTS}"
-                        )
-                        profile.update_connection_status(
-                            f"Reconnecting (Attempt {attempt + 1})"
-                        )
-
-                        # Attempt to reconnect
-                        if await self.service.connect(profile):
-                            # Start device services after reconnection
-                            if hasattr(self.service, "start_services"):
-                                if await self.service.start_services():
-                                    print("Auto-reconnection successful")
-                                    break
-
-                        if attempt < MAX_RECONNECT_ATTEMPTS - 1:
-                            print(
-                                f"Waiting {RECONNECT_DELAY} seconds before next attempt..."
-                            )
-                            await asyncio.sleep(RECONNECT_DELAY)
-                    else:
-                        print("\nAuto-reconnection failed after all attempts")
-                        await self.disconnect()
-                        break
-
-            except Exception as e:
-                print(f"Connection check error: {e}")
-                # Don't disconnect immediately on single error
-                continue
+        RECONNECT_DELAY = 5  # seconds, upper bound between attempts
+        RECONNECT_BASE_DELAY = 0.2  # seconds, doubled after each failed attempt
+
+        try:
+            profile = self.get_connected_device()
+            if not profile:
+                logger.warning("No device profile available for reconnection")
+                await self.disconnect()
+                return
+
+            logger.warning("Connection lost, attempting auto-reconnection...")
+            profile.update_connection_status("Connection Lost")
+
+            # Stop logging if active before showing connection lost
+            if self._stop_view_logging is not None:
+                self._stop_view_logging()
+
+            self.view.show_connection_lost()
+
+            # Stop services before attempting reconnection
+            if self._start_services is not None:
+                await self.service.disconnect()
+                await asyncio.sleep(1)  # Wait for cleanup
+
+            # Try reconnecting up to MAX_RECONNECT_ATTEMPTS times
+            for attempt in range(MAX_RECONNECT_ATTEMPTS):
+                logger.info(
+                    "Auto-reconnection attempt %d/%d",
+                    attempt + 1,
+                    MAX_RECONNECT_ATTEMPTS,
+                )
+                profile.update_connection_status(
+                    f"Reconnecting (Attempt {attempt + 1})"
+                )
+
+                # Attempt to reconnect
+                if await self.service.connect(profile):
+                    # Start device services after reconnection
+                    if self._start_services is not None:
+                        if await self._start_services():
+                            logger.info("Auto-reconnection successful")
+                            break
+
+                if attempt < MAX_RECONNECT_ATTEMPTS - 1:
+                    # Capped exponential backoff, jittered by +/-20%
+                    delay = min(
+                        RECONNECT_DELAY, RECONNECT_BASE_DELAY * 2**attempt
+                    ) * random.uniform(0.8, 1.2)
+                    logger.info("Waiting %.1f seconds before next attempt...", delay)
+                    await asyncio.sleep(delay)
+            else:
+                logger.error("Auto-reconnection failed after all attempts")
+                await self.disconnect()
+
+        except Exception as e:
+            logger.error("Connection check error: %s", e)
+
+    @property
+    def device_manager(self):
+        """Shared DeviceManager, looked up on first use"""
+        if self._device_manager is None:
+            self._device_manager = DeviceManager()
+        return self._device_manager
 
     async def scan_for_devices(self):
         """Scan for nearby BLE devices"""
@@ -84,10 +126,8 @@ class ConnectionPresenter:
 
     async def _start_delayed_services(self, profile, message):
         """Start services and update views after OK is clicked"""
-
-        device_manager = DeviceManager()
         self.view.update_connection_status(True, profile, message)
-        result = await device_manager.start_device_services()
+        result = await self.device_manager.start_device_services()
 
         if not result:
             message = "Service initialization failed"
@@ -109,47 +149,49 @@ class ConnectionPresenter:
     async def connect_to_device(self, device_info):
         """Connect to selected device with delayed main view updates"""
         # Create device profile through presenter
-        device_manager = DeviceManager()
-        profile = device_manager.presenters["profile"].create_profile(device_info)
+        profile = self.device_manager.presenters["profile"].create_profile(device_info)
         profile.update_connection_status("Connecting...")
 
         # 1. Basic connection only
         result = await self.service.connect(profile)
         if not result:
             message = "Connection failed"
-            if hasattr(self.view, "connection_dialog") and self.view.connection_dialog:
-                self.view.connection_dialog.connection_success = False
-                self.view.connection_dialog.status_dialog.show_failed()
+            dialog = getattr(self.view, "connection_dialog", None)
+            if dialog:
+                dialog.connection_success = False
+                dialog.status_dialog.show_failed()
             return False
 
         # 2. Show connection success and start countdown
         message = f"Connected to {profile.name}"
         profile.update_connection_status("Connected")
 
-        if hasattr(self.view, "connection_dialog") and self.view.connection_dialog:
-            self.view.connection_dialog.connection_success = True
+        dialog = getattr(self.view, "connection_dialog", None)
+        if dialog:
+            dialog.connection_success = True
             # Set callback for countdown completion
-            self.view.connection_dialog.status_dialog.set_ok_callback(
-                lambda: self._on_ok_clicked(profile, message)
+            dialog.status_dialog.set_ok_callback(
+                partial(self._on_ok_clicked, profile, message)
             )
             # Show connected state and start countdown
-            self.view.connection_dialog.status_dialog.show_connected(profile)
+            dialog.status_dialog.show_connected(profile)
 
         return True
 
     async def disconnect(self):
         """Disconnect from current device"""
         try:
-            print("[ConnectionPresenter] Starting disconnect")
+            logger.debug("Starting disconnect")
             # Stop heartbeat monitoring before disconnecting
             self.view.stop_heartbeat()
+            self._stop_monitoring()
 
             # Stop logging if active before disconnecting
-            if hasattr(self.view, "_stop_logging"):
-                print("[ConnectionPresenter] Calling _stop_logging")
-                self.view._stop_logging()
+            if self._stop_view_logging is not None:
+                logger.debug("Calling _stop_logging")
+                self._stop_view_logging()
             else:
-                print("[ConnectionPresenter] No _stop_logging method found")
+                logger.debug("No _stop_logging method found")
 
             # Get profile before disconnecting
             profile = self.get_connected_device()
@@ -157,7 +199,7 @@ class ConnectionPresenter:
                 profile.update_connection_status("Disconnecting...")
 
             # Clear all displays
-            print("[ConnectionPresenter] Calling clear_values")
+            logger.debug("Calling clear_values")
             self.view.clear_values()
 
             # Disconnect from device (this will stop all notifications)
@@ -170,7 +212,7 @@ class ConnectionPresenter:
             return result
 
         except Exception as e:
-            print(f"Error during disconnect: {e}")
+            logger.error("Error during disconnect: %s", e)
             return False
 
     def is_connected(self):
@@ -1,4 +1,4 @@
-from src.model.gamepad import ButtonsData, JoystickData
+import asyncio
 
 
 class GamepadPresenter:
@@ -16,8 +16,6 @@ class GamepadPresenter:
         self.service = ble_service
         self.view.service = ble_service  # Set service for configuration
         self.view.loop = loop  # Set event loop for async operations
-        self._current_joystick_data = None
-        self._current_buttons_data = None
 
         # Initially disable buttons until connection is established
         self.view.set_button_states(False)
@@ -25,11 +23,9 @@ class GamepadPresenter:
     async def start_notifications(self):
         """Start gamepad notifications"""
         if self.service:
-            joystick_success = await self.service.start_joystick_notify(
-                self._handle_joystick_update
-            )
-            buttons_success = await self.service.start_buttons_notify(
-                self._handle_buttons_update
+            joystick_success, buttons_success = await asyncio.gather(
+                self.service.start_joystick_notify(self._handle_joystick_update),
+                self.service.start_buttons_notify(self._handle_buttons_update),
             )
             if joystick_success and buttons_success:
                 self.view.set_button_states(True)
@@ -51,12 +47,13 @@ class GamepadPresenter:
             sender: The characteristic that sent the notification
             joystick_data: JoystickData object containing joystick data
         """
-        if joystick_data and isinstance(joystick_data, JoystickData):
-            self._current_joystick_data = joystick_data
-            # Update view with new values
-            self.view.update_xy_values(joystick_data.x, joystick_data.y)
-            # Update joystick button state
-            self.view.update_joystick_button_state(bool(joystick_data.button_state))
+        if joystick_data is None:
+            return
+
+        # Update view with new values
+        self.view.update_xy_values(joystick_data.x, joystick_data.y)
+        # Update joystick button state
+        self.view.update_joystick_button_state(bool(joystick_data.button_state))
 
     async def _handle_buttons_update(self, sender, buttons_data):
         """Handle buttons data updates
@@ -65,8 +62,8 @@ class GamepadPresenter:
             sender: The characteristic that sent the notification
             buttons_data: ButtonsData object containing buttons data
         """
-        if buttons_data and isinstance(buttons_data, ButtonsData):
-            self._current_buttons_data = buttons_data
-            # Update view with new button states
-            for i, state in enumerate(buttons_data.states):
-                self.view.update_button_state(i, bool(state))
+        if buttons_data is None:
+            return
+
+        # Update view with new button states
+        self.view.update_button_states(buttons_data.states)
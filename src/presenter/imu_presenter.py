@@ -1,5 +1,9 @@
+import logging
+
 from src.model.imu import IMUData, IMUEulerData
 
+logger = logging.getLogger(__name__)
+
 
 class IMUPresenter:
     """Presenter for IMU data operations"""
@@ -132,7 +136,7 @@ class IMUPresenter:
                 return result
 
         except Exception as e:
-            print(f"Error stopping Euler notifications: {e}")
+            logger.error("Error stopping Euler notifications: %s", e)
             return False
 
     def set_log_dialog(self, dialog):
@@ -142,9 +146,9 @@ class IMUPresenter:
             self.latest_imu_data = None
             self.latest_euler_data = None
 
-    def set_logger(self, logger):
+    def set_logger(self, imu_logger):
         """Set IMU logger instance"""
-        self.logger = logger
+        self.logger = imu_logger
 
     async def _notification_handler(self, sender, data):
         """Handle incoming notifications"""
@@ -173,11 +177,7 @@ class IMUPresenter:
     async def _update_euler_async(self, euler_data):
         """Update view with Euler angles and calibration status asynchronously"""
         if hasattr(self.view, "update_euler"):
-            self.view.update_euler(
-                euler_data.euler["pitch"],
-                euler_data.euler["roll"],
-                euler_data.euler["yaw"],
-            )
+            self.view.update_euler(euler_data.pitch, euler_data.roll, euler_data.yaw)
             if hasattr(self.view, "update_calib_status"):
                 self.view.update_calib_status(euler_data.calib_status)
 
@@ -187,13 +187,9 @@ class IMUPresenter:
 
     def _update_view(self, imu_data):
         """Update view with IMU data"""
-        self.view.update_accel(
-            imu_data.accel["x"], imu_data.accel["y"], imu_data.accel["z"]
-        )
-        self.view.update_gyro(
-            imu_data.gyro["x"], imu_data.gyro["y"], imu_data.gyro["z"]
-        )
-        self.view.update_magn(imu_data.mag["x"], imu_data.mag["y"], imu_data.mag["z"])
+        self.view.update_accel(imu_data.ax, imu_data.ay, imu_data.az)
+        self.view.update_gyro(imu_data.gx, imu_data.gy, imu_data.gz)
+        self.view.update_magn(imu_data.mx, imu_data.my, imu_data.mz)
 
     def is_notifying(self):
         """Check if notifications are active"""
@@ -1,5 +1,9 @@
+import logging
+
 from src.util.log_manager import LogManager
 
+logger = logging.getLogger(__name__)
+
 
 class LogPresenter:
     """Presenter for handling log view operations"""
@@ -45,10 +49,10 @@ class LogPresenter:
         try:
             # Enable button when services are started
             self.view.set_button_states(True)
-            print("✓ Started log service")
+            logger.info("✓ Started log service")
             return True
         except Exception as e:
-            print(f"Error starting log service: {e}")
+            logger.error("Error starting log service: %s", e)
             return False
 
     async def stop_notifications(self):
@@ -47,10 +47,12 @@ class OverallStatusPresenter:
 
     async def _handle_status_update(self, sender, status_data):
         """Handle status updates from the BLE service"""
-        if status_data and isinstance(status_data, OverallStatus):
-            self._current_status = status_data
-            self.view.update_status(
-                status_data.fuelgause == OverallStatus.RUNNING,
-                status_data.imu1 == OverallStatus.RUNNING,
-                status_data.imu2 == OverallStatus.RUNNING,
-            )
+        if status_data is None:
+            return
+
+        self._current_status = status_data
+        self.view.update_status(
+            status_data.fuelgause == OverallStatus.RUNNING,
+            status_data.imu1 == OverallStatus.RUNNING,
+            status_data.imu2 == OverallStatus.RUNNING,
+        )
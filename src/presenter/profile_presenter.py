@@ -1,5 +1,9 @@
+import logging
+
 from src.model.profile import DeviceProfile
 
+logger = logging.getLogger(__name__)
+
 
 class ProfilePresenter:
     """Presenter for handling device profile information"""
@@ -20,7 +24,7 @@ class ProfilePresenter:
             await self.esp32_service.start_profile_notifications(self.view)
             return True
         except Exception as e:
-            print(f"Error starting profile notifications: {e}")
+            logger.error("Error starting profile notifications: %s", e)
             return False
 
     async def stop_notifications(self):
@@ -39,7 +43,7 @@ class ProfilePresenter:
 
             return True
         except Exception as e:
-            print(f"Error stopping profile notifications: {e}")
+            logger.error("Error stopping profile notifications: %s", e)
             return False
 
     def create_profile(self, device_info):
@@ -57,7 +61,9 @@ class ProfilePresenter:
             device_info["rssi"] if isinstance(device_info, dict) else device_info.rssi
         )
 
-        self.device_profile = DeviceProfile(address=address, name=name, rssi=rssi)
+        self.device_profile = DeviceProfile.create(
+            address=address, name=name, rssi=rssi
+        )
         return self.device_profile
 
     def update_view(self):
@@ -1,4 +1,7 @@
-from src.model.sensor import FlexSensorData, ForceSensorData
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 class SensorPresenter:
@@ -16,8 +19,9 @@ class SensorPresenter:
         self.service = ble_service
         self.view.service = ble_service  # Set service for configuration
         self.view.loop = loop  # Set event loop for async operations
-        self._current_flex_data = None
-        self._current_force_data = None
+        # Samples waiting for their counterpart before one row is logged
+        self._pending_flex = None
+        self._pending_force = None
         self.sensor_logger = None
 
         # Initially disable buttons until connection is established
@@ -26,11 +30,9 @@ class SensorPresenter:
     async def start_notifications(self):
         """Start sensor notifications"""
         if self.service:
-            flex_success = await self.service.start_flex_sensor_notify(
-                self._handle_flex_update
-            )
-            force_success = await self.service.start_force_sensor_notify(
-                self._handle_force_update
+            flex_success, force_success = await asyncio.gather(
+                self.service.start_flex_sensor_notify(self._handle_flex_update),
+                self.service.start_force_sensor_notify(self._handle_force_update),
             )
             if flex_success and force_success:
                 self.view.set_button_states(True)
@@ -54,15 +56,15 @@ class SensorPresenter:
 
                 self.view.set_button_states(False)
 
-                # Clear current data
-                self._current_flex_data = None
-                self._current_force_data = None
+                # Drop any half-received pair
+                self._pending_flex = None
+                self._pending_force = None
         except Exception as e:
-            print(f"Error stopping sensor notifications: {e}")
+            logger.error("Error stopping sensor notifications: %s", e)
 
-    def set_logger(self, logger):
+    def set_logger(self, sensor_logger):
         """Set sensor logger instance"""
-        self.sensor_logger = logger
+        self.sensor_logger = sensor_logger
 
     async def _handle_flex_update(self, sender, flex_data):
         """Handle flex sensor data updates
@@ -71,21 +73,17 @@ class SensorPresenter:
             sender: The characteristic that sent the notification
             flex_data: FlexSensorData object containing sensor data
         """
-        if flex_data and isinstance(flex_data, FlexSensorData):
-            self._current_flex_data = flex_data
-            # Update view with new values
-            for i, value in enumerate(flex_data.values, 1):
-                self.view.update_flex_sensor(i, value)
-
-            # Write to log if force data is also available
-            if (
-                self._current_force_data
-                and self.sensor_logger
-                and self.sensor_logger.is_logging
-            ):
-                self.sensor_logger.write_csv(
-                    flex_data.values, self._current_force_data.value
-                )
+        if flex_data is None:
+            return
+
+        # Update view with new values
+        self.view.update_flex_sensors(flex_data.values)
+
+        # Log one row once the matching force sample has also arrived
+        if self._pending_force is None:
+            self._pending_flex = flex_data
+        else:
+            self._log_pair(flex_data, self._pending_force)
 
     async def _handle_force_update(self, sender, force_data):
         """Handle force sensor data updates
@@ -94,17 +92,21 @@ class SensorPresenter:
             sender: The characteristic that sent the notification
             force_data: ForceSensorData object containing sensor data
         """
-        if force_data and isinstance(force_data, ForceSensorData):
-            self._current_force_data = force_data
-            # Update view with new value
-            self.view.update_force_sensor(force_data.value)
-
-            # Write to log if flex data is also available
-            if (
-                self._current_flex_data
-                and self.sensor_logger
-                and self.sensor_logger.is_logging
-            ):
-                self.sensor_logger.write_csv(
-                    self._current_flex_data.values, force_data.value
-                )
+        if force_data is None:
+            return
+
+        # Update view with new value
+        self.view.update_force_sensor(force_data.value)
+
+        # Log one row once the matching flex sample has also arrived
+        if self._pending_flex is None:
+            self._pending_force = force_data
+        else:
+            self._log_pair(self._pending_flex, force_data)
+
+    def _log_pair(self, flex_data, force_data):
+        """Write one CSV row for a flex/force pair and start a new pair"""
+        self._pending_flex = None
+        self._pending_force = None
+        if self.sensor_logger and self.sensor_logger.is_logging:
+            self.sensor_logger.write_csv(flex_data.values, force_data.value)
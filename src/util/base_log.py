@@ -1,59 +1,80 @@
 import csv
-import datetime
+import logging
 import os
-import queue
-import threading
 import time
 
 from src.model.log_abs import LogABS
 from src.model.profile import DeviceProfile
+from src.util.shared_log_writer import SharedLogWriter
+
+logger = logging.getLogger(__name__)
 
 
 class BaseLog(LogABS):
     """Base logger class with common functionality for queue processing"""
 
-    def __init__(self):
+    # Write buffer per log file, and how often buffered rows are flushed (s)
+    FILE_BUFFER_SIZE = 1 << 20
+    FLUSH_INTERVAL = 0.1
+
+    def __init__(self, shared_writer=None):
+        """Initialize logger
+
+        Args:
+            shared_writer: SharedLogWriter whose thread writes this log's rows,
+                or None to give the log a writer thread of its own
+        """
         super().__init__()
         self.is_logging = False
-        self.stop_thread = False
         self.file = None
         self.writer = None
         self.row_count = 0
-        self.queue = queue.Queue(maxsize=1000)
-        self.thread = None
+        self.shared_writer = shared_writer or SharedLogWriter()
+        self._last_flush = 0.0
+        self._epoch_offset_ns = 0
+        self._session_time = None
+
+    def _enqueue(self, data):
+        """Queue an item for the shared writer thread"""
+        self.shared_writer.enqueue(self, data)
+
+    def _write_batch(self, batch):
+        """Write a batch of queued items with a single writerows call"""
+        if not self.writer:
+            return
 
-    def _process_queue(self):
-        """Process data queue"""
-        while not self.stop_thread:
-            try:
-                data = self.queue.get(timeout=0.1)
-                if self.writer:
-                    self._write_row(data)
-                self.queue.task_done()
-            except queue.Empty:
-                continue
-
-        # Sau khi nhận lệnh stop, xử lý nốt dữ liệu còn trong queue
-        self._process_remaining_data()
-
-    def _process_remaining_data(self):
-        """Process any remaining data in the queue before stopping"""
+        rows = [self._format_row(data) for data in batch]
         try:
-            while True:
-                # Get data without waiting (non-blocking)
-                data = self.queue.get_nowait()
-                if self.writer:
-                    self._write_row(data)
-                self.queue.task_done()
-        except queue.Empty:
-            pass
-
-    def setup_header(self, writer=None, file=None):
+            self._write_rows(rows)
+            self._flush_if_due()
+        except OSError as e:
+            # Disk full or file gone; stop writing rather than fail every batch
+            logger.error(
+                "%s: write failed, logging stopped: %s", self._get_filename(), e
+            )
+            self.writer = None
+            return
+        self.row_count += len(batch)
+
+    def _write_rows(self, rows):
+        """Write formatted rows to the file"""
+        self.writer.writerows(rows)
+
+    def _timestamp_ms(self):
+        """Epoch time in ms, read from the monotonic clock so rows stay ordered"""
+        return (self._epoch_offset_ns + time.monotonic_ns()) // 1_000_000
+
+    def _flush_if_due(self):
+        """Flush the file once FLUSH_INTERVAL has passed since the last flush"""
+        now = time.monotonic()
+        if now - self._last_flush >= self.FLUSH_INTERVAL:
+            self.file.flush()
+            self._last_flush = now
+
+    def setup_header(self, writer=None):
         """Write CSV file header with common format and specific columns"""
         if not writer:
             writer = self.writer
-        if not file:
-            file = self.file
         if not writer:
             return
 
@@ -61,8 +82,8 @@ class BaseLog(LogABS):
             profile = DeviceProfile.get_instance()
 
             # Write common header
-            now = datetime.datetime.now()
-            writer.writerow([f"{now.strftime('%H:%M:%S_%Y%m%d')} version 00.00.01"])
+            started = time.strftime("%H:%M:%S_%Y%m%d", self._session_time)
+            writer.writerow([f"{started} version 00.00.01"])
             writer.writerow([f"Device: {profile.name}, Firmware: {profile.firmware}"])
             writer.writerow([])
 
@@ -70,16 +91,13 @@ class BaseLog(LogABS):
             headers = self._get_headers()
             if headers:
                 writer.writerow(headers)
-            file.flush()
-        except:
-            pass
+        except (OSError, ValueError) as e:
+            logger.warning("Failed to write log header: %s", e)
 
-    def setup_footer(self, writer=None, file=None, row_count=None):
+    def setup_footer(self, writer=None, row_count=None):
         """Write CSV file footer with common format"""
         if not writer:
             writer = self.writer
-        if not file:
-            file = self.file
         if row_count is None:
             row_count = self.row_count
         if not writer:
@@ -90,21 +108,19 @@ class BaseLog(LogABS):
             writer.writerow(["Summary"])
             writer.writerow([f"Total rows: {row_count}"])
             writer.writerow(["End of recording"])
-            file.flush()
-        except:
-            pass
+        except (OSError, ValueError) as e:
+            logger.warning("Failed to write log footer: %s", e)
 
     def _initialize_log_file(self, filename):
         """Initialize a new log file with common setup"""
         file_path = os.path.join(self.folder_path, filename)
-        file = open(file_path, "w", newline="")
+        file = open(file_path, "w", newline="", buffering=self.FILE_BUFFER_SIZE)
         writer = csv.writer(file)
         return file, writer
 
     def _create_log_folder(self, base_folder):
         """Create timestamped log folder"""
-        now = datetime.datetime.now()
-        subfolder = now.strftime("%d%m%Y_%H%M%S_vr_glove")
+        subfolder = time.strftime("%d%m%Y_%H%M%S_vr_glove", self._session_time)
         self.folder_path = os.path.join(base_folder, subfolder)
         os.makedirs(self.folder_path, exist_ok=True)
 
@@ -112,21 +128,26 @@ class BaseLog(LogABS):
         """Get filename for log file - Must be implemented by subclasses"""
         raise NotImplementedError
 
-    def start_logging(self, base_folder):
-        """Start logging - Common implementation"""
-        # Create new queue and thread
-        self.queue = queue.Queue(maxsize=1000)
-        self.stop_thread = False
+    def start_logging(self, base_folder, session_time=None):
+        """Start logging - Common implementation
+
+        Args:
+            base_folder: Folder in which the timestamped log folder is created
+            session_time: time.struct_time shared by logs started together, so
+                they use the same folder and header time; None means now
+        """
+        self._session_time = session_time or time.localtime()
         self.is_logging = True
+        self._last_flush = time.monotonic()
+        self._epoch_offset_ns = time.time_ns() - time.monotonic_ns()
 
         # Create log folder and file
         self._create_log_folder(base_folder)
         self.file, self.writer = self._initialize_log_file(self._get_filename())
         self.setup_header()
 
-        # Start processing thread
-        self.thread = threading.Thread(target=self._process_queue, daemon=True)
-        self.thread.start()
+        # Register with the writer thread, starting it if this is the first log
+        self.shared_writer.start()
         return True
 
     def stop_logging(self):
@@ -134,29 +155,34 @@ class BaseLog(LogABS):
         if not self.is_logging:
             return
 
-        # Signal thread to stop and wait for remaining data
+        # Stop queueing, then let the writer write out what is already queued
         self.is_logging = False
-        self.stop_thread = True
-
-        if self.thread and self.thread.is_alive():
-            # Wait for thread to finish processing queue
-            self.queue.join()
-            self.thread.join(timeout=1.0)
+        self.shared_writer.stop()
 
         # Write footer and close file
         if self.writer:
             self.setup_footer()
         if self.file:
-            self.file.close()
+            try:
+                # Make sure the finished recording is on disk, not just cached
+                self.file.flush()
+                os.fsync(self.file.fileno())
+            except OSError as e:
+                # Fails the same way as row writes on a full disk
+                logger.error("%s: final flush failed: %s", self._get_filename(), e)
+            try:
+                self.file.close()
+            except OSError:
+                # Already reported above; the handle is released regardless
+                pass
 
         # Reset all attributes
-        self.thread = None
         self.file = None
         self.writer = None
         self.row_count = 0
 
-    def _write_row(self, data):
-        """Write a single row of data to CSV - Must be implemented by subclasses"""
+    def _format_row(self, data):
+        """Convert a queued item to a CSV row - Must be implemented by subclasses"""
         raise NotImplementedError
 
     def _get_headers(self):
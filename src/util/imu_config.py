@@ -1,3 +1,6 @@
+from types import MappingProxyType
+from typing import Mapping
+
 from src.config.constant import BLEConstants
 
 
@@ -14,34 +17,41 @@ class IMUConfigUtil:
     IMU2_GYRO_RANGE_POS = 9
     IMU2_MAG_RANGE_POS = 10
 
+    # Read-only position tables for IMU1 and IMU2, built once
+    _POSITIONS = (
+        MappingProxyType(
+            {
+                "accel_gyro_freq": IMU1_ACCEL_GYRO_FREQ_POS,
+                "mag_freq": IMU1_MAG_FREQ_POS,
+                "accel_range": IMU1_ACCEL_RANGE_POS,
+                "gyro_range": IMU1_GYRO_RANGE_POS,
+                "mag_range": IMU1_MAG_RANGE_POS,
+            }
+        ),
+        MappingProxyType(
+            {
+                "accel_gyro_freq": IMU2_ACCEL_GYRO_FREQ_POS,
+                "mag_freq": IMU2_MAG_FREQ_POS,
+                "accel_range": IMU2_ACCEL_RANGE_POS,
+                "gyro_range": IMU2_GYRO_RANGE_POS,
+                "mag_range": IMU2_MAG_RANGE_POS,
+            }
+        ),
+    )
+
     @staticmethod
-    def get_imu_config_positions(imu_number: int) -> dict:
+    def get_imu_config_positions(imu_number: int) -> Mapping[str, int]:
         """Get byte positions for IMU configuration parameters.
 
         Args:
             imu_number: IMU number (1 or 2)
 
         Returns:
-            Dictionary containing byte positions for the IMU config
+            Read-only mapping of byte positions for the IMU config
         """
-        if imu_number == 1:
-            return {
-                "accel_gyro_freq": IMUConfigUtil.IMU1_ACCEL_GYRO_FREQ_POS,
-                "mag_freq": IMUConfigUtil.IMU1_MAG_FREQ_POS,
-                "accel_range": IMUConfigUtil.IMU1_ACCEL_RANGE_POS,
-                "gyro_range": IMUConfigUtil.IMU1_GYRO_RANGE_POS,
-                "mag_range": IMUConfigUtil.IMU1_MAG_RANGE_POS,
-            }
-        elif imu_number == 2:
-            return {
-                "accel_gyro_freq": IMUConfigUtil.IMU2_ACCEL_GYRO_FREQ_POS,
-                "mag_freq": IMUConfigUtil.IMU2_MAG_FREQ_POS,
-                "accel_range": IMUConfigUtil.IMU2_ACCEL_RANGE_POS,
-                "gyro_range": IMUConfigUtil.IMU2_GYRO_RANGE_POS,
-                "mag_range": IMUConfigUtil.IMU2_MAG_RANGE_POS,
-            }
-        else:
+        if imu_number not in (1, 2):
             raise ValueError("IMU number must be 1 or 2")
+        return IMUConfigUtil._POSITIONS[imu_number - 1]
 
     @staticmethod
     def get_config_from_bytes(data: bytearray, imu_number: int) -> dict:
@@ -83,21 +93,22 @@ class IMUConfigUtil:
         positions = IMUConfigUtil.get_imu_config_positions(imu_number)
         new_config = bytearray(data)
 
-        # Update config bytes with new values
-        new_config[positions["accel_gyro_freq"]] = BLEConstants.ACCEL_GYRO_FREQ_REV_MAP[
-            config["accel_gyro_rate"]
-        ]
-        new_config[positions["mag_freq"]] = BLEConstants.MAG_FREQ_REV_MAP[
-            config["mag_rate"]
-        ]
-        new_config[positions["accel_range"]] = BLEConstants.ACCEL_RANGE_REV_MAP[
-            config["accel_range"]
-        ]
-        new_config[positions["gyro_range"]] = BLEConstants.GYRO_RANGE_REV_MAP[
-            config["gyro_range"]
-        ]
-        new_config[positions["mag_range"]] = BLEConstants.MAG_RANGE_REV_MAP[
-            config["mag_range"]
-        ]
+        # Frequencies and ranges each occupy consecutive bytes, so write them
+        # as two slices
+        freq_pos = positions["accel_gyro_freq"]
+        new_config[freq_pos : freq_pos + 2] = bytes(
+            (
+                BLEConstants.ACCEL_GYRO_FREQ_REV_MAP[config["accel_gyro_rate"]],
+                BLEConstants.MAG_FREQ_REV_MAP[config["mag_rate"]],
+            )
+        )
+        range_pos = positions["accel_range"]
+        new_config[range_pos : range_pos + 3] = bytes(
+            (
+                BLEConstants.ACCEL_RANGE_REV_MAP[config["accel_range"]],
+                BLEConstants.GYRO_RANGE_REV_MAP[config["gyro_range"]],
+                BLEConstants.MAG_RANGE_REV_MAP[config["mag_range"]],
+            )
+        )
 
         return new_config
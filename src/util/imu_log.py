@@ -1,76 +1,65 @@
-import queue
-import time
+from collections import namedtuple
 
 from src.util.base_log import BaseLog
 
+# Column order matches IMUData.to_row
+IMU_HEADERS = (
+    "timestamp",
+    "ax",
+    "ay",
+    "az",
+    "gx",
+    "gy",
+    "gz",
+    "mx",
+    "my",
+    "mz",
+    "ex",
+    "ey",
+    "ez",
+)
+
+# Row layout for IMU_HEADERS: int timestamp and axes, float euler angles.
+# Ends in \r\n to match csv.writer's default line terminator.
+_ROW_FORMAT = ",".join(["%d"] * 10 + ["%.6f"] * 3) + "\r\n"
+
+# One queued IMU sample
+_IMUSample = namedtuple("_IMUSample", "timestamp imu_data euler_data")
+
 
 class IMULog(BaseLog):
     """IMU logger with thread queue processing"""
 
-    def __init__(self, imu_number):
-        super().__init__()
+    def __init__(self, imu_number, shared_writer=None):
+        super().__init__(shared_writer)
         self.imu_number = imu_number
 
     def write_csv(self, imu_data, euler_data):
-        """Queue IMU data for writing"""
+        """Queue IMU data for writing
+
+        Args:
+            imu_data: IMUData sample
+            euler_data: IMUEulerData sample
+        """
         if not self.is_logging:
             return
 
-        try:
-            data = {
-                "timestamp": int(time.time() * 1000),
-                "imu_data": imu_data,
-                "euler_data": euler_data,
-            }
-            self.queue.put(data, block=False)
-        except queue.Full:
-            pass
-
-    def _write_row(self, data):
-        """Write IMU data row to CSV"""
-        try:
-            imu_data = data["imu_data"]
-            euler_data = data["euler_data"]
+        self._enqueue(_IMUSample(self._timestamp_ms(), imu_data, euler_data))
 
-            row = [
-                data["timestamp"],
-                imu_data.accel["x"],
-                imu_data.accel["y"],
-                imu_data.accel["z"],
-                imu_data.gyro["x"],
-                imu_data.gyro["y"],
-                imu_data.gyro["z"],
-                imu_data.mag["x"],
-                imu_data.mag["y"],
-                imu_data.mag["z"],
-                euler_data.euler["yaw"],
-                euler_data.euler["pitch"],
-                euler_data.euler["roll"],
-            ]
+    def _format_row(self, data):
+        """Build an IMU CSV row"""
+        euler_data = data.euler_data
+        return data.imu_data.to_row(
+            data.timestamp, euler_data.yaw, euler_data.pitch, euler_data.roll
+        )
 
-            self.writer.writerow(row)
-            self.file.flush()
-            self.row_count += 1
-        except:
-            pass
+    def _write_rows(self, rows):
+        """Write IMU rows as one string; all fields are numeric, so no quoting"""
+        self.file.write("".join([_ROW_FORMAT % row for row in rows]))
 
     def _get_headers(self):
         """Get headers for IMU CSV file"""
-        return [
-            "timestamp",
-            "ax",
-            "ay",
-            "az",
-            "gx",
-            "gy",
-            "gz",
-            "mx",
-            "my",
-            "mz",
-            "ex",
-            "ey",
-            "ez",
-        ]
+        return IMU_HEADERS
 
     def _get_filename(self):
         """Get filename for IMU log file"""
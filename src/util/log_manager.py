@@ -1,18 +1,47 @@
+import logging
+import threading
+import time
+
+from src.util.imu_log import IMULog
+from src.util.sensor_log import SensorLog
+from src.util.shared_log_writer import SharedLogWriter
+
+logger = logging.getLogger(__name__)
+
+
 class LogManager:
     """Singleton manager for handling shared log folder selection and loggers"""
 
+    __slots__ = (
+        "selected_folder",
+        "folder_path",
+        "_folder_change_callbacks",
+        "shared_writer",
+        "imu1_logger",
+        "imu2_logger",
+        "sensor_logger",
+    )
+
     _instance = None
+    _instance_lock = threading.Lock()
 
     @classmethod
     def instance(cls):
-        if not cls._instance:
-            cls._instance = cls()
+        if cls._instance is None:
+            with cls._instance_lock:
+                # Re-check: another thread may have created it while we waited
+                if cls._instance is None:
+                    cls._instance = cls()
         return cls._instance
 
     def __init__(self):
         self.selected_folder = "C:/ProjectIT/ES_iot/log"  # Default path
         self.folder_path = None
-        self._folder_change_callbacks = []
+        # Replaced, never mutated, so notification can iterate without a copy
+        self._folder_change_callbacks = ()
+
+        # One writer thread serves every logger
+        self.shared_writer = SharedLogWriter()
 
         # Logger instances will be created when needed
         self.imu1_logger = None
@@ -24,20 +53,23 @@ class LogManager:
     def add_folder_change_callback(self, callback):
         """Add callback to be notified of folder changes"""
         if callback not in self._folder_change_callbacks:
-            self._folder_change_callbacks.append(callback)
+            self._folder_change_callbacks += (callback,)
 
     def remove_folder_change_callback(self, callback):
         """Remove folder change callback"""
         if callback in self._folder_change_callbacks:
-            self._folder_change_callbacks.remove(callback)
+            self._folder_change_callbacks = tuple(
+                cb for cb in self._folder_change_callbacks if cb != callback
+            )
 
     def _notify_folder_change(self):
         """Notify all registered callbacks of folder change"""
+        folder = self.selected_folder
         for callback in self._folder_change_callbacks:
             try:
-                callback(self.selected_folder)
-            except:
-                pass
+                callback(folder)
+            except Exception as e:
+                logger.error("Folder change callback failed: %s", e)
 
     def setup_logging_folder(self, base_folder):
         """Set up logging folder path"""
@@ -61,25 +93,19 @@ class LogManager:
     def get_imu1_logger(self):
         """Get IMU1 logger instance"""
         if not self.imu1_logger:
-            from src.util.imu_log import IMULog
-
-            self.imu1_logger = IMULog(1)
+            self.imu1_logger = IMULog(1, self.shared_writer)
         return self.imu1_logger
 
     def get_imu2_logger(self):
         """Get IMU2 logger instance"""
         if not self.imu2_logger:
-            from src.util.imu_log import IMULog
-
-            self.imu2_logger = IMULog(2)
+            self.imu2_logger = IMULog(2, self.shared_writer)
         return self.imu2_logger
 
     def get_sensor_logger(self):
         """Get sensor logger instance"""
         if not self.sensor_logger:
-            from src.util.sensor_log import SensorLog
-
-            self.sensor_logger = SensorLog()
+            self.sensor_logger = SensorLog(self.shared_writer)
         return self.sensor_logger
 
     def start_all_logging(self):
@@ -87,26 +113,36 @@ class LogManager:
         if not self.selected_folder:
             return False
 
+        # Taken once so every logger writes into the same session folder
+        session_time = time.localtime()
+
         try:
             # Start IMU1 logging
-            if not self.get_imu1_logger().start_logging(self.selected_folder):
+            if not self.get_imu1_logger().start_logging(
+                self.selected_folder, session_time
+            ):
                 return False
 
             # Start IMU2 logging
-            if not self.get_imu2_logger().start_logging(self.selected_folder):
+            if not self.get_imu2_logger().start_logging(
+                self.selected_folder, session_time
+            ):
                 self.imu1_logger.stop_logging()
                 return False
 
             # Start sensor logging
-            if not self.get_sensor_logger().start_logging(self.selected_folder):
+            if not self.get_sensor_logger().start_logging(
+                self.selected_folder, session_time
+            ):
                 self.imu1_logger.stop_logging()
                 self.imu2_logger.stop_logging()
                 return False
 
+            self.folder_path = self.imu1_logger.folder_path
             return True
 
         except Exception as e:
-            print(f"Error starting logging: {e}")
+            logger.error("Error starting logging: %s", e)
             self.stop_all_logging()
             return False
 
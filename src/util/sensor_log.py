@@ -1,8 +1,25 @@
-import queue
-import time
+from collections import namedtuple
 
 from src.util.base_log import BaseLog
 
+# Column order matches SensorLog._format_row
+SENSOR_HEADERS = (
+    "timestamp",
+    "flex1",
+    "flex2",
+    "flex3",
+    "flex4",
+    "flex5",
+    "force",
+)
+
+# Row layout: int timestamp, five flex values, then force. Ends in \r\n to
+# match csv.writer's default line terminator.
+_ROW_FORMAT = "%d" + ",%.6f" * 6 + "\r\n"
+
+# One queued flex/force sample
+_SensorSample = namedtuple("_SensorSample", "timestamp flex_values force_value")
+
 
 class SensorLog(BaseLog):
     """Sensor logger with thread queue processing"""
@@ -12,36 +29,19 @@ class SensorLog(BaseLog):
         if not self.is_logging:
             return
 
-        try:
-            data = {
-                "timestamp": int(time.time() * 1000),
-                "flex_values": flex_values,
-                "force_value": force_value,
-            }
-            self.queue.put(data, block=False)
-        except queue.Full:
-            pass
-
-    def _write_row(self, data):
-        """Write a single row of sensor data to CSV"""
-        try:
-            flex_values = data["flex_values"]
-            row = [data["timestamp"]]
-            row.extend(flex_values)
-            row.append(data["force_value"])
-
-            self.writer.writerow(row)
-            self.file.flush()
-            self.row_count += 1
-        except:
-            pass
+        self._enqueue(_SensorSample(self._timestamp_ms(), flex_values, force_value))
+
+    def _format_row(self, data):
+        """Build a sensor CSV row"""
+        return (data.timestamp, *data.flex_values, data.force_value)
+
+    def _write_rows(self, rows):
+        """Write sensor rows as one string; all fields are numeric, so no quoting"""
+        self.file.write("".join([_ROW_FORMAT % row for row in rows]))
 
     def _get_headers(self):
         """Get headers for sensor CSV file"""
-        headers = ["timestamp"]
-        headers.extend([f"flex{i+1}" for i in range(5)])
-        headers.append("force")
-        return headers
+        return SENSOR_HEADERS
 
     def _get_filename(self):
         """Get filename for sensor log file"""
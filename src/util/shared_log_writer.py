@@ -0,0 +1,123 @@
+import logging
+import threading
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+
+class SharedLogWriter:
+    """Single writer thread that drains queued rows for several BaseLog streams"""
+
+    # Pending samples, across all streams, held before the oldest are dropped
+    QUEUE_SIZE = 32768
+
+    # Maximum number of queued items taken per pass
+    BATCH_SIZE = 128
+
+    def __init__(self):
+        # deque append/popleft are atomic, so producers and writer need no lock
+        self.queue = deque(maxlen=self.QUEUE_SIZE)
+        self.dropped_count = 0
+        self.thread = None
+        self._data_ready = threading.Event()
+        # Serialises draining between the writer thread and a stopping stream
+        self._write_lock = threading.Lock()
+        # Drain buffer reused by every pass; only touched under _write_lock
+        self._batch = []
+        self._stopping = False
+        # Guards the stream count and starting/stopping the thread
+        self._state_lock = threading.Lock()
+        self._streams = 0
+
+    def enqueue(self, log, data):
+        """Queue an item for log, dropping the oldest item when full"""
+        if len(self.queue) == self.QUEUE_SIZE:
+            self.dropped_count += 1
+        self.queue.append((log, data))
+        self._data_ready.set()
+
+    def start(self):
+        """Register a logging stream, starting the thread for the first one"""
+        with self._state_lock:
+            self._streams += 1
+            if self.thread is not None:
+                return
+
+            self.queue.clear()
+            self.dropped_count = 0
+            self._stopping = False
+            self._data_ready.clear()
+            self.thread = threading.Thread(target=self._process_queue, daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        """Unregister a stream once everything queued so far is written
+
+        The thread keeps running until the last stream stops.
+        """
+        with self._state_lock:
+            self._streams = max(self._streams - 1, 0)
+            if self.thread is None:
+                return
+            if self._streams:
+                self.write_pending()
+                return
+
+            # Wake the writer and wait for it to finish processing the queue
+            self._stopping = True
+            self._data_ready.set()
+            self.thread.join()
+            self.thread = None
+
+        if self.dropped_count:
+            logger.warning(
+                "Dropped %d rows because the write queue was full",
+                self.dropped_count,
+            )
+
+    def _process_queue(self):
+        """Process data queue, sleeping until data arrives or logging stops"""
+        while not self._stopping:
+            self._data_ready.wait()
+            self._data_ready.clear()
+            self.write_pending()
+
+        # Sau khi nhận lệnh stop, xử lý nốt dữ liệu còn trong queue
+        self.write_pending()
+
+    def write_pending(self):
+        """Write everything currently queued, one batch per stream per pass"""
+        with self._write_lock:
+            batch = self._batch
+            while self.queue:
+                batch.clear()
+                self._drain_into(batch)
+                self._dispatch(batch)
+            batch.clear()
+
+    def _drain_into(self, batch):
+        """Top up batch with queued items, up to BATCH_SIZE"""
+        popleft = self.queue.popleft
+        try:
+            while len(batch) < self.BATCH_SIZE:
+                batch.append(popleft())
+        except IndexError:
+            pass
+
+    def _dispatch(self, batch):
+        """Hand each stream its items from batch, keeping their order"""
+        per_log = {}
+        for log, data in batch:
+            items = per_log.get(log)
+            if items is None:
+                per_log[log] = items = []
+            items.append(data)
+
+        for log, items in per_log.items():
+            try:
+                log._write_batch(items)
+            except Exception as e:
+                # Keep the thread alive for the other streams
+                logger.error(
+                    "%s: dropped %d rows: %s", log._get_filename(), len(items), e
+                )
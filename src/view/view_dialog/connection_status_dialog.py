@@ -86,7 +86,7 @@ class ConnectionStatusDialog(BaseDialog):
             await asyncio.sleep(0.5)
 
         # Trigger the callback to start application
-        if not self._destroyed and self.ok_callback:
+        if not self._destroyed and self.ok_callback is not None:
             self.ok_callback()
 
         # Close both dialogs
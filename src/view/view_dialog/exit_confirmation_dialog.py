@@ -1,5 +1,4 @@
-from dataclasses import dataclass
-from typing import Callable, Optional, Protocol
+from typing import Optional, Protocol
 
 import customtkinter as ctk
 
@@ -1,9 +1,8 @@
 from dataclasses import dataclass
-from typing import Callable, Dict, Optional, TypedDict
+from typing import Callable, Optional, TypedDict
 
 import customtkinter as ctk
 
-from src.config.app_config import AppConfig
 from src.config.constant import BLEConstants
 from src.view.view_component.button_component import ButtonComponent
 from src.view.view_component.imu_config_list_item import IMUConfigListItem
@@ -3,7 +3,6 @@ from typing import Callable, Optional
 
 import customtkinter as ctk
 
-from src.config.app_config import AppConfig
 from src.view.view_component.button_component import ButtonComponent
 from src.view.view_component.coordinate_entry import CoordinateEntry
 
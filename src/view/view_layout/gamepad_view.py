@@ -99,6 +99,7 @@ class GamepadView(ctk.CTkFrame):
                 state,
             )
             self.button_frames.append(frame)
+        self._button_active = list(button_states)
 
         # The last button frame needs different padding
         self.button_frames[-1].grid(padx=0)  # Remove right padding for last button
@@ -177,10 +178,21 @@ class GamepadView(ctk.CTkFrame):
 
     def update_button_state(self, button_index, is_active):
         if 0 <= button_index < len(self.button_frames):
+            self._button_active[button_index] = is_active
             self.button_frames[button_index].configure(
                 fg_color=self.config.BUTTON_COLOR if is_active else self.config.FRAME_BG
             )
 
+    def update_button_states(self, states):
+        """Update all button indicators, reconfiguring only those that changed"""
+        active_color = self.config.BUTTON_COLOR
+        idle_color = self.config.FRAME_BG
+        for i, (frame, is_active) in enumerate(zip(self.button_frames, states)):
+            is_active = bool(is_active)
+            if is_active != self._button_active[i]:
+                self._button_active[i] = is_active
+                frame.configure(fg_color=active_color if is_active else idle_color)
+
     def create_xy_container(self):
         """Create the XY coordinate display container"""
         xy_frame = ctk.CTkFrame(
@@ -5,7 +5,6 @@ import customtkinter as ctk
 
 from src.config.app_config import AppConfig
 from src.util.log_manager import LogManager
-from src.view.view_component import ButtonComponent
 
 
 @dataclass
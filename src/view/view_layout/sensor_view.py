@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import customtkinter as ctk
 
@@ -188,6 +188,11 @@ class SensorView(ctk.CTkFrame):
         if sensor_id in self.flex_entries:
             self.flex_entries[sensor_id].set_value(value)
 
+    def update_flex_sensors(self, values: List[float]) -> None:
+        """Update all flex sensor values at once, in sensor order"""
+        for entry, value in zip(self.flex_entries.values(), values):
+            entry.set_value(value)
+
     def update_force_sensor(self, value: float) -> None:
         """Update force sensor value"""
         self.force_entry.set_value(value)